@@ -15,6 +15,7 @@ from contextlib import asynccontextmanager
 from rapid_minutes.config.settings import get_settings
 from rapid_minutes.web.routes import router
 from rapid_minutes.storage.file_manager import FileManager
+from rapid_minutes.document.word_generator import WordGenerator
 from src.rapid_minutes.diagnostics.system_diagnostics import SystemDiagnostics
 
 settings = get_settings()
@@ -33,6 +34,8 @@ async def lifespan(app: FastAPI):
     await file_manager._initialize_directories()
     yield
     logger.info("Shutting down Rapid Minutes Export Application")
+    # Let in-flight PDF conversions finish before the process exits
+    WordGenerator.shutdown_pdf_executor()
 
 app = FastAPI(
     title="Rapid Minutes Export",
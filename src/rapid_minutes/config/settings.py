@@ -24,7 +24,7 @@ class Settings(BaseSettings):
     input_dir: str = Field(default="./data/input", env="INPUT_DIR")
     upload_dir: str = Field(default="./uploads", env="UPLOAD_DIR")
     output_dir: str = Field(default="./data/output", env="OUTPUT_DIR")
-    temp_dir: str = Field(default="./data/temp", env="TEMP_DIR")
+    temp_dir: str = Field(default="./data/temp", env="TEMP_DIR")  # Keep on the same mount as output_dir so moves are a single rename
     static_dir: str = Field(default="./static", env="STATIC_DIR")
     
     # File Processing Configuration  
@@ -4,20 +4,25 @@ Advanced Word document template processing and manipulation
 Implements ICE principle - Intuitive template processing with comprehensive document handling
 """
 
+import io
 import logging
+import mmap
 import os
+import re
+import tempfile
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+from xml.sax.saxutils import escape
 
 try:
     from docx import Document
     from docx.shared import Inches, Pt
     from docx.enum.text import WD_ALIGN_PARAGRAPH
     from docx.enum.table import WD_TABLE_ALIGNMENT
-    from docx.oxml import OxmlElement
-    from docx.oxml.ns import qn
+    from docx.oxml import OxmlElement, parse_xml
+    from docx.oxml.ns import qn, nsdecls
     DOCX_AVAILABLE = True
 except ImportError:
     DOCX_AVAILABLE = False
@@ -27,6 +32,14 @@ from ..config import settings
 
 logger = logging.getLogger(__name__)
 
+# Close the current text run element around a break or tab, the way
+# python-docx's run text setter renders "\n", "\r" and "\t"
+_RUN_TEXT_BREAKS = str.maketrans({
+    "\n": '</w:t><w:br/><w:t xml:space="preserve">',
+    "\r": '</w:t><w:br/><w:t xml:space="preserve">',
+    "\t": '</w:t><w:tab/><w:t xml:space="preserve">',
+})
+
 
 @dataclass
 class TemplateField:
@@ -98,6 +111,17 @@ class WordEngine:
             '{{NEXT_MEETING}}': 'next_meeting',
         }
         
+        # Precompiled placeholder patterns (text and bytes) built from the field mappings
+        placeholder_pattern = '|'.join(re.escape(placeholder) for placeholder in self._field_mappings)
+        self._placeholder_re = re.compile(placeholder_pattern)
+        self._placeholder_re_bytes = re.compile(placeholder_pattern.encode('utf-8'))
+        
+        # Value formatters keyed on exact type; anything else is formatted with str()
+        self._value_formatters = {
+            list: self._format_list,
+            dict: self._format_dict,
+        }
+        
         if not DOCX_AVAILABLE:
             logger.warning("⚠️ python-docx not available - using text-based processing")
         
@@ -123,13 +147,14 @@ class WordEngine:
         start_time = datetime.utcnow()
         options = options or {}
         
-        if not os.path.exists(template_path):
+        template_file = Path(template_path)
+        if not template_file.exists():
             return ProcessingResult(
                 success=False,
                 error_message=f"Template file not found: {template_path}"
             )
         
-        logger.info(f"📄 Processing Word template: {os.path.basename(template_path)}")
+        logger.info(f"📄 Processing Word template: {template_file.name}")
         
         try:
             if DOCX_AVAILABLE:
@@ -173,11 +198,14 @@ class WordEngine:
             processed_fields = []
             warnings = []
             
+            # Format each data key once; aliased placeholders share the result
+            formatted_values = self._format_values(template_data)
+            
             # Process paragraphs
             for paragraph in doc.paragraphs:
                 original_text = paragraph.text
                 if self._contains_placeholder(original_text):
-                    new_text = self._replace_placeholders(original_text, template_data)
+                    new_text = self._replace_placeholders(original_text, template_data, formatted_values)
                     if new_text != original_text:
                         paragraph.text = new_text
                         processed_fields.extend(self._extract_processed_fields(original_text))
@@ -189,7 +217,7 @@ class WordEngine:
                         for paragraph in cell.paragraphs:
                             original_text = paragraph.text
                             if self._contains_placeholder(original_text):
-                                new_text = self._replace_placeholders(original_text, template_data)
+                                new_text = self._replace_placeholders(original_text, template_data, formatted_values)
                                 if new_text != original_text:
                                     paragraph.text = new_text
                                     processed_fields.extend(self._extract_processed_fields(original_text))
@@ -201,8 +229,22 @@ class WordEngine:
             output_filename = self._generate_output_filename(template_path, options)
             output_path = os.path.join(self.temp_dir, output_filename)
             
-            # Save processed document
-            doc.save(output_path)
+            # Save processed document to memory, then move it into place atomically
+            doc_buffer = io.BytesIO()
+            doc.save(doc_buffer)
+            document_bytes = doc_buffer.getvalue()
+            # A unique temp name keeps concurrent renders of one output name apart
+            fd, temp_output_path = tempfile.mkstemp(dir=self.temp_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(document_bytes)
+                os.replace(temp_output_path, output_path)
+            except BaseException:
+                try:
+                    os.unlink(temp_output_path)
+                except OSError:
+                    pass
+                raise
             
             return ProcessingResult(
                 success=True,
@@ -212,7 +254,9 @@ class WordEngine:
                 metadata={
                     'template_file': os.path.basename(template_path),
                     'output_file': output_filename,
-                    'fields_processed': len(set(processed_fields))
+                    'fields_processed': len(set(processed_fields)),
+                    # Saved bytes, so downstream consumers can skip re-reading the file
+                    'document_bytes': document_bytes
                 }
             )
             
@@ -230,20 +274,34 @@ class WordEngine:
     ) -> ProcessingResult:
         """Fallback text-based template processing"""
         try:
-            # Read template as text
-            with open(template_path, 'r', encoding='utf-8') as f:
-                template_content = f.read()
+            processed_fields = []
+            formatted_values = self._format_values(template_data)
+            replacements = {
+                placeholder.encode('utf-8'): (data_key, formatted_values[data_key].encode('utf-8'))
+                for placeholder, data_key in self._field_mappings.items()
+            }
             
-            # Replace placeholders
-            processed_content = self._replace_placeholders(template_content, template_data)
-            processed_fields = self._extract_processed_fields(template_content)
+            def replace_placeholder(match: 're.Match') -> bytes:
+                data_key, replacement = replacements[match.group(0)]
+                if data_key not in processed_fields:
+                    processed_fields.append(data_key)
+                return replacement
+            
+            # Substitute placeholders directly over the mapped template bytes;
+            # only the substituted values are decoded/encoded
+            with open(template_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        processed_content = self._placeholder_re_bytes.sub(replace_placeholder, mm)
+                else:
+                    processed_content = b''
             
             # Generate output filename
             output_filename = self._generate_output_filename(template_path, options, '.txt')
             output_path = os.path.join(self.temp_dir, output_filename)
             
             # Save processed content
-            with open(output_path, 'w', encoding='utf-8') as f:
+            with open(output_path, 'wb') as f:
                 f.write(processed_content)
             
             return ProcessingResult(
@@ -343,21 +401,23 @@ class WordEngine:
         if not placeholder_para or not agenda:
             return
         
-        # Insert agenda items
+        # Build all agenda paragraphs, then insert them in one batch
+        paragraphs = []
         for i, item in enumerate(agenda, 1):
             # Add agenda item title
-            title_para = placeholder_para.insert_paragraph_before(f"{i}. {item.get('title', '')}")
-            title_para.style = 'Heading 3'
+            paragraphs.append((f"{i}. {item.get('title', '')}", 'Heading 3'))
             
             # Add description if available
             if item.get('description'):
-                desc_para = placeholder_para.insert_paragraph_before(f"   說明: {item['description']}")
+                paragraphs.append((f"   說明: {item['description']}", None))
             
             # Add key points
             if item.get('key_points'):
-                points_para = placeholder_para.insert_paragraph_before("   討論要點:")
+                paragraphs.append(("   討論要點:", None))
                 for point in item['key_points']:
-                    placeholder_para.insert_paragraph_before(f"     • {point}")
+                    paragraphs.append((f"     • {point}", None))
+        
+        self._insert_paragraphs_before(doc, placeholder_para, paragraphs)
         
         # Remove placeholder
         placeholder_para.clear()
@@ -407,68 +467,102 @@ class WordEngine:
         if not placeholder_para or not decisions:
             return
         
-        # Insert decisions
+        # Build all decision paragraphs, then insert them in one batch
+        paragraphs = []
         for i, decision in enumerate(decisions, 1):
-            decision_para = placeholder_para.insert_paragraph_before(f"{i}. {decision.get('decision', '')}")
-            decision_para.style = 'List Number'
+            paragraphs.append((f"{i}. {decision.get('decision', '')}", 'List Number'))
             
             if decision.get('rationale'):
-                placeholder_para.insert_paragraph_before(f"   理由: {decision['rationale']}")
+                paragraphs.append((f"   理由: {decision['rationale']}", None))
             
             if decision.get('responsible_party'):
-                placeholder_para.insert_paragraph_before(f"   負責單位: {decision['responsible_party']}")
+                paragraphs.append((f"   負責單位: {decision['responsible_party']}", None))
         
+        self._insert_paragraphs_before(doc, placeholder_para, paragraphs)
         placeholder_para.clear()
     
+    def _insert_paragraphs_before(
+        self,
+        doc: 'Document',
+        placeholder_para,
+        paragraphs: List[tuple]
+    ):
+        """Insert (text, style name) paragraphs before the placeholder with a single XML parse"""
+        style_ids = {}
+        paragraph_xml = []
+        for text, style_name in paragraphs:
+            properties = ''
+            if style_name:
+                if style_name not in style_ids:
+                    style_ids[style_name] = doc.styles[style_name].style_id
+                properties = f'<w:pPr><w:pStyle w:val="{style_ids[style_name]}"/></w:pPr>'
+            paragraph_xml.append(
+                f'<w:p>{properties}<w:r><w:t xml:space="preserve">{escape(text).translate(_RUN_TEXT_BREAKS)}</w:t></w:r></w:p>'
+            )
+        
+        fragment = parse_xml(f'<w:body {nsdecls("w")}>{"".join(paragraph_xml)}</w:body>')
+        anchor = placeholder_para._p
+        for p_element in list(fragment):
+            anchor.addprevious(p_element)
+    
     def _contains_placeholder(self, text: str) -> bool:
         """Check if text contains template placeholders"""
         return any(placeholder in text for placeholder in self._field_mappings.keys())
     
-    def _replace_placeholders(self, text: str, template_data: Dict[str, Any]) -> str:
+    def _replace_placeholders(
+        self,
+        text: str,
+        template_data: Dict[str, Any],
+        formatted_values: Optional[Dict[str, str]] = None
+    ) -> str:
         """Replace placeholders in text with actual data"""
-        result = text
+        if formatted_values is None:
+            formatted_values = self._format_values(template_data)
         
-        for placeholder, data_key in self._field_mappings.items():
-            if placeholder in result:
-                # Handle nested data
-                value = self._get_nested_value(template_data, data_key)
-                
-                if value is not None:
-                    # Format value based on type
-                    if isinstance(value, list):
-                        if data_key == 'key_outcomes':
-                            formatted_value = '\n'.join(f"• {item}" for item in value)
-                        elif data_key == 'attendees':
-                            formatted_value = ', '.join(
-                                attendee.get('name', '') for attendee in value 
-                                if isinstance(attendee, dict)
-                            )
-                            if not formatted_value:
-                                formatted_value = '\n'.join(str(item) for item in value)
-                        else:
-                            formatted_value = ', '.join(str(item) for item in value)
-                    elif isinstance(value, dict):
-                        # Handle next meeting info
-                        if data_key == 'next_meeting':
-                            parts = []
-                            if value.get('date'):
-                                parts.append(f"日期: {value['date']}")
-                            if value.get('time'):
-                                parts.append(f"時間: {value['time']}")
-                            if value.get('location'):
-                                parts.append(f"地點: {value['location']}")
-                            formatted_value = ', '.join(parts) if parts else ''
-                        else:
-                            formatted_value = str(value)
-                    else:
-                        formatted_value = str(value)
-                    
-                    result = result.replace(placeholder, formatted_value)
-                else:
-                    # Replace with empty string if no data
-                    result = result.replace(placeholder, '')
-        
-        return result
+        return self._placeholder_re.sub(
+            lambda match: formatted_values[self._field_mappings[match.group(0)]],
+            text
+        )
+    
+    def _format_values(self, template_data: Dict[str, Any]) -> Dict[str, str]:
+        """Format every mapped data key once per render"""
+        formatted_values = {}
+        for data_key in dict.fromkeys(self._field_mappings.values()):
+            value = self._get_nested_value(template_data, data_key)
+            # Replace with empty string if no data
+            formatted_values[data_key] = '' if value is None else self._format_value(value, data_key)
+        return formatted_values
+    
+    def _format_value(self, value: Any, data_key: str) -> str:
+        """Format a template value based on its type"""
+        formatter = self._value_formatters.get(type(value))
+        return formatter(value, data_key) if formatter else str(value)
+    
+    def _format_list(self, value: List[Any], data_key: str) -> str:
+        """Format list values"""
+        if data_key == 'key_outcomes':
+            return '\n• '.join([''] + [str(item) for item in value])[1:]
+        elif data_key == 'attendees':
+            formatted_value = ', '.join(
+                attendee.get('name', '') for attendee in value 
+                if isinstance(attendee, dict)
+            )
+            return formatted_value or '\n'.join(str(item) for item in value)
+        return ', '.join(str(item) for item in value)
+    
+    def _format_dict(self, value: Dict[str, Any], data_key: str) -> str:
+        """Format dict values"""
+        # Handle next meeting info
+        if data_key == 'next_meeting':
+            parts = []
+            if value.get('date'):
+                parts.append(f"日期: {value['date']}")
+            if value.get('time'):
+                parts.append(f"時間: {value['time']}")
+            if value.get('location'):
+                parts.append(f"地點: {value['location']}")
+            return ', '.join(parts)
+        return str(value)
     
     def _get_nested_value(self, data: Dict, key: str) -> Any:
         """Get nested value from data dictionary"""
@@ -511,45 +605,46 @@ class WordEngine:
     
     async def validate_template(self, template_path: str) -> Dict[str, Any]:
         """Validate template file and extract field information"""
-        if not os.path.exists(template_path):
+        try:
+            template_stat = os.stat(template_path)
+        except FileNotFoundError:
             return {
                 'valid': False,
                 'error': 'Template file not found'
             }
         
         try:
-            if DOCX_AVAILABLE and template_path.endswith('.docx'):
+            if DOCX_AVAILABLE and Path(template_path).suffix == '.docx':
                 doc = Document(template_path)
                 
-                # Extract all text
-                all_text = []
-                for para in doc.paragraphs:
-                    all_text.append(para.text)
-                
-                for table in doc.tables:
-                    for row in table.rows:
-                        for cell in row.cells:
-                            for para in cell.paragraphs:
-                                all_text.append(para.text)
-                
-                full_text = '\n'.join(all_text)
+                # Scan body paragraphs (including table cells) straight from the XML;
+                # run text is joined per paragraph so placeholders split across runs still match
+                paragraph_tag, text_tag = qn('w:p'), qn('w:t')
+                found = {}
+                for p_element in doc.element.body.iter(paragraph_tag):
+                    paragraph_text = ''.join(t.text or '' for t in p_element.iter(text_tag))
+                    if paragraph_text:
+                        found.update(dict.fromkeys(self._placeholder_re.findall(paragraph_text)))
+                found_placeholders = list(found)
                 
             else:
-                # Text-based validation
-                with open(template_path, 'r', encoding='utf-8') as f:
-                    full_text = f.read()
-            
-            # Find placeholders
-            found_placeholders = []
-            for placeholder in self._field_mappings.keys():
-                if placeholder in full_text:
-                    found_placeholders.append(placeholder)
+                # Text-based validation over the mapped template bytes
+                with open(template_path, 'rb') as f:
+                    if os.fstat(f.fileno()).st_size:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            found_bytes = set(self._placeholder_re_bytes.findall(mm))
+                    else:
+                        found_bytes = set()
+                found_placeholders = [
+                    placeholder for placeholder in self._field_mappings
+                    if placeholder.encode('utf-8') in found_bytes
+                ]
             
             return {
                 'valid': True,
                 'placeholders_found': found_placeholders,
                 'total_placeholders': len(found_placeholders),
-                'template_size': os.path.getsize(template_path),
+                'template_size': template_stat.st_size,
                 'supported_fields': list(self._field_mappings.values())
             }
             
@@ -8,7 +8,8 @@ import asyncio
 import logging
 import os
 import shutil
-from typing import Dict, List, Optional, Any
+import tempfile
+from typing import BinaryIO, Dict, List, Optional, Any, Union
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -17,9 +18,12 @@ import hashlib
 import json
 
 from ..config import settings
+from ..utils.helpers import iter_files
 
 logger = logging.getLogger(__name__)
 
+_STREAM_COPY_CHUNK_SIZE = 1024 * 1024
+
 
 @dataclass
 class FileMetadata:
@@ -52,6 +56,9 @@ class FileManager:
         # File registry
         self._file_registry: Dict[str, FileMetadata] = {}
         self._registry_file = self.base_path / "file_registry.json"
+        self._registry_save_scheduled = False
+        self._registry_lock = asyncio.Lock()
+        self._registry_save_task: Optional[asyncio.Task] = None
         
         # Ensure directories exist synchronously
         self._initialize_directories_sync()
@@ -114,8 +121,7 @@ class FileManager:
         checksum = hashlib.sha256(file_data).hexdigest()
         
         # Store file
-        async with aiofiles.open(storage_path, 'wb') as f:
-            await f.write(file_data)
+        await asyncio.to_thread(storage_path.write_bytes, file_data)
         
         # Create metadata
         file_metadata = FileMetadata(
@@ -146,8 +152,7 @@ class FileManager:
         file_metadata = self._file_registry[file_id]
         
         try:
-            async with aiofiles.open(file_metadata.stored_path, 'rb') as f:
-                content = await f.read()
+            content = await asyncio.to_thread(Path(file_metadata.stored_path).read_bytes)
             
             # Update last accessed
             file_metadata.last_accessed = datetime.utcnow()
@@ -205,6 +210,12 @@ class FileManager:
             return False
 
         metadata = self._file_registry[file_id]
+        custom = metadata.custom_metadata
+        # Repeated progress ticks would only bump last_updated; skip the save
+        if (custom.get('status') == status and custom.get('progress') == progress
+                and (not error or custom.get('error') == error)):
+            return True
+
         # Add status tracking to custom metadata
         metadata.custom_metadata.update({
             'status': status,
@@ -214,14 +225,7 @@ class FileManager:
         if error:
             metadata.custom_metadata['error'] = error
 
-        # Save registry synchronously (not ideal but needed for compatibility)
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-            loop.create_task(self._save_registry())
-        except RuntimeError:
-            # If no loop is running, we can't save asynchronously
-            pass
+        self._schedule_registry_save()
 
         return True
 
@@ -232,8 +236,13 @@ class FileManager:
 
         metadata = self._file_registry[file_id]
         try:
-            with open(metadata.stored_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            # Read raw bytes in one go rather than through a buffered text wrapper
+            with open(metadata.stored_path, 'rb', buffering=0) as f:
+                content = f.readall().decode('utf-8')
+            # Match text-mode reads, which translate \r\n and \r to \n
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+            return content
         except Exception as e:
             logger.error(f"Error reading file {file_id}: {e}")
             return None
@@ -243,16 +252,23 @@ class FileManager:
         if file_type not in ['word', 'pdf']:
             return None
 
+        extension = 'docx' if file_type == 'word' else 'pdf'
+
+        # save_output_file writes to a fixed name; check it as a plain str first
+        expected_path = os.path.join(str(self.output_dir), f"meeting_minutes_{file_id}.{extension}")
+        if os.path.isfile(expected_path):
+            return expected_path
+
         # Look for output file in output directory
-        output_file_pattern = f"*{file_id}*.{'docx' if file_type == 'word' else 'pdf'}"
+        output_file_pattern = f"*{file_id}*.{extension}"
         for file_path in self.output_dir.rglob(output_file_pattern):
             if file_path.is_file():
                 return str(file_path)
 
         return None
 
-    def save_output_file(self, file_id: str, content: bytes, file_type: str) -> str:
-        """Save output file (word/pdf)"""
+    def save_output_file(self, file_id: str, content: Union[bytes, BinaryIO], file_type: str) -> str:
+        """Save output file (word/pdf) from bytes or a readable binary stream"""
         if file_type == 'word':
             extension = '.docx'
         elif file_type == 'pdf':
@@ -267,9 +283,12 @@ class FileManager:
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Write output file
+        # Write output file; streams are copied in bounded chunks rather than read whole
         with open(output_path, 'wb') as f:
-            f.write(content)
+            if isinstance(content, (bytes, bytearray, memoryview)):
+                f.write(content)
+            else:
+                shutil.copyfileobj(content, f, _STREAM_COPY_CHUNK_SIZE)
 
         logger.info(f"Output file saved: {output_path}")
         return str(output_path)
@@ -377,23 +396,18 @@ class FileManager:
         """Clean up files that exist on disk but not in registry"""
         cleanup_count = 0
         
-        # Check upload directory
-        if self.upload_dir.exists():
-            for file_path in self.upload_dir.rglob('*'):
-                if file_path.is_file():
-                    # Check if file is registered
-                    registered = any(
-                        Path(meta.stored_path) == file_path 
-                        for meta in self._file_registry.values()
-                    )
-                    
-                    if not registered:
-                        try:
-                            file_path.unlink()
-                            cleanup_count += 1
-                            logger.debug(f"🗑️ Removed orphaned file: {file_path}")
-                        except Exception as e:
-                            logger.warning(f"⚠️ Could not remove orphaned file {file_path}: {e}")
+        # Check upload directory against a set of registered paths, built once
+        registered_paths = {
+            os.path.normpath(meta.stored_path) for meta in self._file_registry.values()
+        }
+        for entry in iter_files(self.upload_dir):
+            if os.path.normpath(entry.path) not in registered_paths:
+                try:
+                    os.unlink(entry.path)
+                    cleanup_count += 1
+                    logger.debug(f"🗑️ Removed orphaned file: {entry.path}")
+                except Exception as e:
+                    logger.warning(f"⚠️ Could not remove orphaned file {entry.path}: {e}")
         
         if cleanup_count > 0:
             logger.info(f"🧹 Cleaned up {cleanup_count} orphaned files")
@@ -427,8 +441,7 @@ class FileManager:
         file_metadata = self._file_registry[file_id]
         
         try:
-            async with aiofiles.open(file_metadata.stored_path, 'rb') as f:
-                content = await f.read()
+            content = await asyncio.to_thread(Path(file_metadata.stored_path).read_bytes)
             
             current_checksum = hashlib.sha256(content).hexdigest()
             return current_checksum == file_metadata.checksum
@@ -464,16 +477,12 @@ class FileManager:
     
     def _get_directory_size(self, directory: Path) -> int:
         """Get total size of directory"""
-        if not directory.exists():
-            return 0
-        
         total_size = 0
-        for file_path in directory.rglob('*'):
-            if file_path.is_file():
-                try:
-                    total_size += file_path.stat().st_size
-                except (OSError, IOError):
-                    pass
+        for entry in iter_files(directory):
+            try:
+                total_size += entry.stat().st_size
+            except (OSError, IOError):
+                pass
         
         return total_size
     
@@ -483,7 +492,7 @@ class FileManager:
             return
 
         try:
-            with open(self._registry_file, 'r') as f:
+            with open(self._registry_file, 'r', encoding='utf-8') as f:
                 data = f.read()
                 registry_data = json.loads(data)
 
@@ -514,7 +523,7 @@ class FileManager:
             return
 
         try:
-            async with aiofiles.open(self._registry_file, 'r') as f:
+            async with aiofiles.open(self._registry_file, 'r', encoding='utf-8') as f:
                 data = await f.read()
                 registry_data = json.loads(data)
 
@@ -539,29 +548,67 @@ class FileManager:
             logger.error(f"❌ Error loading file registry: {e}")
             self._file_registry = {}
     
+    def _schedule_registry_save(self):
+        """Schedule a background registry save, coalescing updates made before it runs"""
+        if self._registry_save_scheduled:
+            # The pending save has not snapshotted the registry yet, so it
+            # will pick up this update as well
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # If no loop is running, we can't save asynchronously
+            return
+        # Keep a reference so the pending save is not garbage collected mid-run
+        self._registry_save_task = loop.create_task(self._save_registry())
+        self._registry_save_scheduled = True
+
     async def _save_registry(self):
         """Save file registry to disk"""
+        # Serialised so overlapping saves never interleave their snapshots or writes
+        async with self._registry_lock:
+            # Cleared before the snapshot, which runs without yielding, so any
+            # later update schedules a fresh save even if this one fails
+            self._registry_save_scheduled = False
+            try:
+                payload = self._serialize_registry()
+                await asyncio.to_thread(self._write_registry_file, payload)
+            except Exception as e:
+                logger.error(f"❌ Error saving file registry: {e}")
+    
+    def _serialize_registry(self) -> str:
+        """Snapshot the registry as compact JSON"""
+        registry_data = {}
+        for file_id, metadata in self._file_registry.items():
+            registry_data[file_id] = {
+                'file_id': metadata.file_id,
+                'original_name': metadata.original_name,
+                'stored_path': metadata.stored_path,
+                'file_size': metadata.file_size,
+                'mime_type': metadata.mime_type,
+                'created_at': metadata.created_at.isoformat(),
+                'last_accessed': metadata.last_accessed.isoformat(),
+                'checksum': metadata.checksum,
+                'tags': metadata.tags,
+                'custom_metadata': metadata.custom_metadata
+            }
+        return json.dumps(registry_data, ensure_ascii=False, separators=(',', ':'))
+    
+    def _write_registry_file(self, payload: str):
+        """Write the registry to a unique temporary file and rename it into place,
+        so a crash mid-write never leaves a truncated registry behind"""
+        fd, temp_path = tempfile.mkstemp(dir=self._registry_file.parent, suffix='.tmp')
         try:
-            registry_data = {}
-            for file_id, metadata in self._file_registry.items():
-                registry_data[file_id] = {
-                    'file_id': metadata.file_id,
-                    'original_name': metadata.original_name,
-                    'stored_path': metadata.stored_path,
-                    'file_size': metadata.file_size,
-                    'mime_type': metadata.mime_type,
-                    'created_at': metadata.created_at.isoformat(),
-                    'last_accessed': metadata.last_accessed.isoformat(),
-                    'checksum': metadata.checksum,
-                    'tags': metadata.tags,
-                    'custom_metadata': metadata.custom_metadata
-                }
-            
-            async with aiofiles.open(self._registry_file, 'w') as f:
-                await f.write(json.dumps(registry_data, indent=2))
-            
-        except Exception as e:
-            logger.error(f"❌ Error saving file registry: {e}")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(temp_path, self._registry_file)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
     
     async def move_file(self, file_id: str, destination_dir: str) -> bool:
         """Move file to different directory"""
@@ -569,10 +616,9 @@ class FileManager:
             return False
         
         file_metadata = self._file_registry[file_id]
-        current_path = Path(file_metadata.stored_path)
-        
-        if not current_path.exists():
+        if not os.path.exists(file_metadata.stored_path):
             return False
+        current_path = Path(file_metadata.stored_path)
         
         # Create destination directory
         dest_dir = Path(destination_dir)
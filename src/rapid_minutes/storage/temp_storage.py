@@ -5,20 +5,29 @@ Implements SESE principle - Simple, Effective, Systematic, Exhaustive temp file
 """
 
 import asyncio
+import errno
+import heapq
 import logging
 import os
 import shutil
-from typing import Dict, List, Optional, Any
+import time
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-import aiofiles
 
 from ..config import settings
+from ..utils.helpers import iter_files
 
 logger = logging.getLogger(__name__)
 
 
+def _read_unbuffered(file_path: str) -> bytes:
+    """Read a whole file straight from the raw file object"""
+    with open(file_path, 'rb', buffering=0) as f:
+        return f.readall()
+
+
 @dataclass
 class TempFileInfo:
     """Temporary file information"""
@@ -47,7 +56,11 @@ class TempStorage:
         # Active temp files registry
         self._temp_files: Dict[str, TempFileInfo] = {}
         self._cleanup_task: Optional[asyncio.Task] = None
-        self._cleanup_interval = 300  # 5 minutes
+        self._cleanup_interval = 300  # 5 minutes, the longest the cleanup loop sleeps
+        
+        # (expiry timestamp, file_id) min-heap; entries made stale by
+        # deletes or TTL extensions are skipped when popped
+        self._expiry_heap: List[Tuple[float, str]] = []
         
         # Ensure temp directory exists
         self.base_temp_dir.mkdir(parents=True, exist_ok=True)
@@ -86,23 +99,11 @@ class TempStorage:
         logger.info(f"💾 Storing temp file: {file_id} ({len(file_data)} bytes) - {purpose}")
         
         try:
-            # Write file
-            async with aiofiles.open(temp_path, 'wb') as f:
-                await f.write(file_data)
+            # Write file in one call on a worker thread
+            await asyncio.to_thread(temp_path.write_bytes, file_data)
             
             # Register temp file
-            temp_info = TempFileInfo(
-                file_id=file_id,
-                file_path=str(temp_path),
-                original_name=original_name,
-                created_at=datetime.utcnow(),
-                last_accessed=datetime.utcnow(),
-                file_size=len(file_data),
-                purpose=purpose,
-                ttl=ttl
-            )
-            
-            self._temp_files[file_id] = temp_info
+            self._register_temp_file(file_id, temp_path, original_name, len(file_data), purpose, ttl)
             
             logger.debug(f"✅ Temp file stored: {file_id} -> {temp_path}")
             return str(temp_path)
@@ -122,8 +123,8 @@ class TempStorage:
         temp_info = self._temp_files[file_id]
         
         try:
-            async with aiofiles.open(temp_info.file_path, 'rb') as f:
-                content = await f.read()
+            # One-shot read without a buffered reader in between
+            content = await asyncio.to_thread(_read_unbuffered, temp_info.file_path)
             
             # Update last accessed
             temp_info.last_accessed = datetime.utcnow()
@@ -158,6 +159,7 @@ class TempStorage:
         
         temp_info = self._temp_files[file_id]
         temp_info.ttl += timedelta(hours=additional_hours)
+        self._schedule_expiry(temp_info)
         
         logger.debug(f"⏰ Extended TTL for temp file {file_id} by {additional_hours}h")
         return True
@@ -214,19 +216,10 @@ class TempStorage:
     
     async def cleanup_orphaned_files(self) -> int:
         """Clean up orphaned files in temp directory"""
-        cleanup_count = 0
-        registered_paths = {info.file_path for info in self._temp_files.values()}
-        
-        # Check all files in temp directory
-        for file_path in self.base_temp_dir.rglob('*'):
-            if file_path.is_file():
-                if str(file_path) not in registered_paths:
-                    try:
-                        file_path.unlink()
-                        cleanup_count += 1
-                        logger.debug(f"🗑️ Removed orphaned temp file: {file_path}")
-                    except Exception as e:
-                        logger.warning(f"⚠️ Could not remove orphaned file {file_path}: {e}")
+        registered_paths = frozenset(info.file_path for info in self._temp_files.values())
+        
+        # Walk and unlink off the event loop in one hop
+        cleanup_count = await asyncio.to_thread(self._remove_unregistered_files, registered_paths)
         
         if cleanup_count > 0:
             logger.info(f"🧹 Cleaned up {cleanup_count} orphaned temp files")
@@ -235,13 +228,15 @@ class TempStorage:
     
     async def emergency_cleanup(self) -> int:
         """Emergency cleanup - remove all temporary files"""
-        cleanup_count = len(self._temp_files)
+        registered_paths = [info.file_path for info in self._temp_files.values()]
+        cleanup_count = len(registered_paths)
         
-        # Delete all registered files
-        for file_id in list(self._temp_files.keys()):
-            await self.delete_file(file_id)
+        # Drop the whole registry at once; stale heap entries would only point at missing ids
+        self._temp_files.clear()
+        self._expiry_heap.clear()
         
-        # Clean up orphaned files
+        # Delete all registered files, then anything else left in the temp tree
+        await asyncio.to_thread(self._unlink_files, registered_paths)
         orphaned_count = await self.cleanup_orphaned_files()
         
         logger.warning(f"🚨 Emergency cleanup completed: {cleanup_count + orphaned_count} files removed")
@@ -285,13 +280,25 @@ class TempStorage:
         if not Path(source_path).exists():
             raise FileNotFoundError(f"Source file not found: {source_path}")
         
-        # Read source file
-        async with aiofiles.open(source_path, 'rb') as f:
-            file_data = await f.read()
-        
-        # Store as temporary file
         original_name = Path(source_path).name
-        return await self.store_file(file_id, file_data, original_name, purpose)
+        temp_path = await self._generate_temp_path(file_id, original_name)
+        
+        try:
+            # Let the OS copy the data (sendfile where available) instead of
+            # reading the whole file into memory and writing it back out
+            await asyncio.to_thread(shutil.copyfile, source_path, temp_path)
+            file_size = os.path.getsize(temp_path)
+        except Exception as e:
+            logger.error(f"❌ Error copying to temp file {file_id}: {e}")
+            # Cleanup on error
+            if temp_path.exists():
+                temp_path.unlink()
+            raise
+        
+        self._register_temp_file(file_id, temp_path, original_name, file_size, purpose, self.default_ttl)
+        
+        logger.info(f"💾 Copied temp file: {file_id} ({file_size} bytes) - {purpose}")
+        return str(temp_path)
     
     async def move_to_permanent(self, file_id: str, destination_path: str) -> bool:
         """Move temporary file to permanent location"""
@@ -299,18 +306,24 @@ class TempStorage:
             return False
         
         temp_info = self._temp_files[file_id]
+        if not os.path.exists(temp_info.file_path):
+            return False
+
         source_path = Path(temp_info.file_path)
         dest_path = Path(destination_path)
         
-        if not source_path.exists():
-            return False
-        
         try:
             # Ensure destination directory exists
             dest_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Move file
-            shutil.move(str(source_path), str(dest_path))
+            # Same-mount moves are one atomic rename; fall back to copy + unlink across devices
+            try:
+                await asyncio.to_thread(os.replace, temp_info.file_path, str(dest_path))
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                await asyncio.to_thread(shutil.copyfile, temp_info.file_path, str(dest_path))
+                os.unlink(temp_info.file_path)
             
             # Remove from temp registry
             del self._temp_files[file_id]
@@ -335,13 +348,58 @@ class TempStorage:
         file_extension = Path(original_name).suffix
         return temp_subdir / f"temp_{file_id}{file_extension}"
     
+    def _register_temp_file(
+        self,
+        file_id: str,
+        temp_path: Path,
+        original_name: str,
+        file_size: int,
+        purpose: str,
+        ttl: timedelta
+    ):
+        """Record a temporary file in the registry"""
+        self._temp_files[file_id] = TempFileInfo(
+            file_id=file_id,
+            file_path=str(temp_path),
+            original_name=original_name,
+            created_at=datetime.utcnow(),
+            last_accessed=datetime.utcnow(),
+            file_size=file_size,
+            purpose=purpose,
+            ttl=ttl
+        )
+        self._schedule_expiry(self._temp_files[file_id])
+    
+    def _schedule_expiry(self, temp_info: TempFileInfo):
+        """Queue the file's expiry time for the cleanup loop"""
+        remaining = temp_info.created_at + temp_info.ttl - datetime.utcnow()
+        heapq.heappush(self._expiry_heap, (time.time() + remaining.total_seconds(), temp_info.file_id))
+    
+    async def _evict_due_files(self) -> float:
+        """Delete files whose expiry has passed; return seconds until the next expiry"""
+        now = time.time()
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            _, file_id = heapq.heappop(self._expiry_heap)
+            temp_info = self._temp_files.get(file_id)
+            # Deleted or extended since this entry was queued
+            if temp_info is None or datetime.utcnow() - temp_info.created_at < temp_info.ttl:
+                continue
+            await self.delete_file(file_id)
+        
+        if not self._expiry_heap:
+            return self._cleanup_interval
+        return self._expiry_heap[0][0] - now
+    
     def _start_cleanup_task(self):
         """Start background cleanup task"""
         async def cleanup_loop():
+            delay = self._cleanup_interval
             while True:
                 try:
-                    await asyncio.sleep(self._cleanup_interval)
-                    await self.cleanup_expired_files()
+                    # Sleep until the next expiry, capped so files stored
+                    # meanwhile with a shorter TTL are not overlooked for long
+                    await asyncio.sleep(min(self._cleanup_interval, max(1, delay)))
+                    delay = await self._evict_due_files()
                 except asyncio.CancelledError:
                     break
                 except Exception as e:
@@ -354,16 +412,37 @@ class TempStorage:
         """Calculate total size of temp directory"""
         total_size = 0
         
-        if self.base_temp_dir.exists():
-            for file_path in self.base_temp_dir.rglob('*'):
-                if file_path.is_file():
-                    try:
-                        total_size += file_path.stat().st_size
-                    except (OSError, IOError):
-                        pass
+        for entry in iter_files(self.base_temp_dir):
+            try:
+                total_size += entry.stat().st_size
+            except (OSError, IOError):
+                pass
         
         return total_size
     
+    def _remove_unregistered_files(self, registered_paths: frozenset) -> int:
+        """Unlink every file under the temp tree that is not in registered_paths"""
+        removed = 0
+        for entry in iter_files(self.base_temp_dir):
+            if entry.path not in registered_paths:
+                try:
+                    os.unlink(entry.path)
+                    removed += 1
+                    logger.debug(f"🗑️ Removed orphaned temp file: {entry.path}")
+                except Exception as e:
+                    logger.warning(f"⚠️ Could not remove orphaned file {entry.path}: {e}")
+        return removed
+    
+    def _unlink_files(self, file_paths: List[str]):
+        """Unlink the given files, ignoring ones that are already gone"""
+        for file_path in file_paths:
+            try:
+                os.unlink(file_path)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.error(f"❌ Error deleting temp file {file_path}: {e}")
+    
     async def __aenter__(self):
         """Async context manager entry"""
         return self
@@ -405,19 +484,22 @@ class TempStorage:
         purpose: str = "batch_processing"
     ) -> List[str]:
         """Store multiple files in batch"""
-        stored_paths = []
+        # The writes are independent, so run them concurrently on the thread pool
+        results = await asyncio.gather(
+            *(
+                self.store_file(file_info['file_id'], file_info['data'], file_info['name'], purpose)
+                for file_info in files
+            ),
+            return_exceptions=True
+        )
         
-        for file_info in files:
-            file_id = file_info['file_id']
-            file_data = file_info['data']
-            original_name = file_info['name']
-            
-            try:
-                path = await self.store_file(file_id, file_data, original_name, purpose)
-                stored_paths.append(path)
-            except Exception as e:
-                logger.error(f"❌ Failed to store file {file_id} in batch: {e}")
+        stored_paths = []
+        for file_info, result in zip(files, results):
+            if isinstance(result, BaseException):
+                logger.error(f"❌ Failed to store file {file_info['file_id']} in batch: {result}")
                 stored_paths.append(None)
+            else:
+                stored_paths.append(result)
         
         logger.info(f"📦 Batch stored {len([p for p in stored_paths if p])} of {len(files)} files")
         return stored_paths
\ No newline at end of file
@@ -4,18 +4,30 @@ Custom exception handlers for comprehensive error management
 """
 
 import logging
+from importlib.util import find_spec
 from fastapi import Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 
+# ORJSONResponse imports fine without orjson and only fails when rendering,
+# so the optional package itself decides which response class is used
+ErrorResponse = ORJSONResponse if find_spec("orjson") else JSONResponse
+
 logger = logging.getLogger(__name__)
 
+# Static part of the 500 envelope; only request_id varies per request
+_INTERNAL_ERROR_ENVELOPE = {
+    "success": False,
+    "error": "Internal Server Error",
+    "message": "An unexpected error occurred",
+}
+
 
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle request validation errors"""
     logger.warning(f"Validation error for {request.url}: {exc}")
     
-    return JSONResponse(
+    return ErrorResponse(
         status_code=422,
         content={
             "success": False,
@@ -31,7 +43,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
     """Handle HTTP exceptions"""
     logger.error(f"HTTP error {exc.status_code} for {request.url}: {exc.detail}")
     
-    return JSONResponse(
+    return ErrorResponse(
         status_code=exc.status_code,
         content={
             "success": False,
@@ -46,12 +58,7 @@ async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions"""
     logger.error(f"Unhandled exception for {request.url}: {exc}", exc_info=True)
     
-    return JSONResponse(
+    return ErrorResponse(
         status_code=500,
-        content={
-            "success": False,
-            "error": "Internal Server Error",
-            "message": "An unexpected error occurred",
-            "request_id": getattr(request.state, 'request_id', None)
-        }
+        content={**_INTERNAL_ERROR_ENVELOPE, "request_id": getattr(request.state, 'request_id', None)}
     )
\ No newline at end of file
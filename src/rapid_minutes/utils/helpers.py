@@ -8,7 +8,9 @@ import asyncio
 import logging
 import hashlib
 import json
-import uuid
+import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import Any, Dict, List, Optional, Union, Callable, TypeVar
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -16,10 +18,146 @@ import time
 import functools
 import os
 
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+try:
+    from rapidfuzz.fuzz import ratio as _rapidfuzz_ratio
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    from difflib import SequenceMatcher
+    RAPIDFUZZ_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    # Hand datetimes and dataclasses to default=str, as the stdlib path does
+    _ORJSON_DUMPS_OPTIONS = (
+        orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+_CHECKSUM_BLOCK_SIZE = 1024 * 1024
+_HASH_CACHE_MAX_TEXT = 256
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+_UNSAFE_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+_MULTI_UNDERSCORE = re.compile(r'_+')
+_WHITESPACE_RUN = re.compile(r'\s+')
+_SLUG_INVALID_CHARS = re.compile(r'[^a-zA-Z0-9\s-]')
+_SLUG_SEPARATORS = re.compile(r'[\s-]+')
+# ASCII characters _SLUG_INVALID_CHARS would strip, as a str.translate deletion table
+_SLUG_ASCII_DELETE = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128) if _SLUG_INVALID_CHARS.match(chr(c))
+))
+# Email, card and phone alternatives fused so masking is a single scan; card precedes
+# phone so a full card number is not split into phone-sized pieces
+_SENSITIVE_PATTERN = re.compile(
+    r'(?P<EMAIL>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b)'
+    r'|(?P<CARD>\b(?:\d{4}[-\s]?){3}\d{4}\b)'
+    r'|(?P<PHONE>\b(?:\+?1[-.\s]?)?(?:\(?[0-9]{3}\)?[-.\s]?)?[0-9]{3}[-.\s]?[0-9]{4}\b)'
+)
+_SENSITIVE_MASKS = {
+    'EMAIL': '[EMAIL_MASKED]',
+    'CARD': '[CARD_MASKED]',
+    'PHONE': '[PHONE_MASKED]',
+}
+
+
+@functools.lru_cache(maxsize=4)
+def _format_timezone_offset(offset_seconds: int) -> str:
+    """Format a UTC offset; keyed on the seconds so a tzset() change still shows up"""
+    offset_hours = offset_seconds // 3600
+    offset_minutes = (abs(offset_seconds) % 3600) // 60
+    sign = '+' if offset_seconds >= 0 else '-'
+    return f"{sign}{abs(offset_hours):02d}:{offset_minutes:02d}"
+
+
+@functools.lru_cache(maxsize=1)
+def _process_for_pid(pid: int):
+    """psutil.Process for the current pid; keyed on pid so a forked child gets its own"""
+    import psutil
+    return psutil.Process(pid)
+
+
+def _rss_bytes() -> int:
+    """Resident set size of this process, read from /proc/self/statm when available"""
+    try:
+        with open('/proc/self/statm', 'rb') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return _process_for_pid(os.getpid()).memory_info().rss
+
+
+@functools.lru_cache(maxsize=64)
+def _split_env_list(value: str, separator: str) -> tuple:
+    """Split and strip an environment list value"""
+    return tuple(item.strip() for item in value.split(separator) if item.strip())
+
+
+@functools.lru_cache(maxsize=16)
+def _word_pattern(min_length: int) -> re.Pattern:
+    """Compiled word pattern for a given minimum length"""
+    return re.compile(r'\b[a-zA-Z]{' + str(min_length) + r',}\b')
+
+
+def iter_files(directory: Union[str, Path]):
+    """Yield a DirEntry for every file below directory, reusing scandir's cached file type
+    
+    Symlinked directories are not followed, and entries or subtrees that
+    cannot be read are skipped.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from iter_files(entry.path)
+                    elif entry.is_file():
+                        yield entry
+                except OSError:
+                    continue
+    except OSError:
+        return
+
+
+def _scan_directory_size(path: str) -> int:
+    """Sum file sizes below path, reusing scandir's cached entry types"""
+    total_size = 0
+    for entry in iter_files(path):
+        try:
+            total_size += entry.stat().st_size
+        except OSError:
+            pass
+    return total_size
+
+
+def _new_hash(algorithm: str, **blake3_kwargs):
+    """Create a hash object; 'blake3' needs the optional blake3 package"""
+    if algorithm == 'blake3' and BLAKE3_AVAILABLE:
+        return blake3.blake3(**blake3_kwargs)
+    return hashlib.new(algorithm)
+
+
+def _hexdigest(text: str, algorithm: str) -> str:
+    """Hex digest of a UTF-8 encoded string"""
+    hash_algo = _new_hash(algorithm)
+    hash_algo.update(text.encode('utf-8'))
+    return hash_algo.hexdigest()
+
+
+_cached_hexdigest = functools.lru_cache(maxsize=4096)(_hexdigest)
+
 
 class DateTimeHelper:
     """Date and time utility functions"""
@@ -32,6 +170,14 @@ class DateTimeHelper:
     @staticmethod
     def parse_flexible_date(date_str: str) -> Optional[datetime]:
         """Parse date string in various formats"""
+        # ISO-8601 dates (as produced by now_iso) skip dateparser's locale machinery
+        if isinstance(date_str, str) and len(date_str) >= 10 and date_str[4] == '-' and date_str[7] == '-':
+            iso_str = date_str[:-1] + '+00:00' if date_str.endswith('Z') else date_str
+            try:
+                return datetime.fromisoformat(iso_str)
+            except ValueError:
+                pass
+        
         import dateparser
         try:
             return dateparser.parse(date_str)
@@ -59,12 +205,8 @@ class DateTimeHelper:
     @staticmethod
     def get_timezone_offset() -> str:
         """Get current timezone offset string"""
-        import time
         offset_seconds = -time.timezone if time.daylight == 0 else -time.altzone
-        offset_hours = offset_seconds // 3600
-        offset_minutes = (abs(offset_seconds) % 3600) // 60
-        sign = '+' if offset_seconds >= 0 else '-'
-        return f"{sign}{abs(offset_hours):02d}:{offset_minutes:02d}"
+        return _format_timezone_offset(offset_seconds)
 
 
 class FileHelper:
@@ -80,6 +222,11 @@ class FileHelper:
     @staticmethod
     def get_file_size_human(size_bytes: int) -> str:
         """Convert bytes to human-readable format"""
+        if isinstance(size_bytes, int) and size_bytes > 0:
+            # Each unit is 2**10 of the previous, so bit_length picks the unit directly
+            exponent = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+            return f"{size_bytes / (1 << (exponent * 10)):.1f} {_SIZE_UNITS[exponent]}"
+        
         for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
             if size_bytes < 1024:
                 return f"{size_bytes:.1f} {unit}"
@@ -88,15 +235,49 @@ class FileHelper:
     
     @staticmethod
     def calculate_checksum(file_path: str, algorithm: str = 'sha256') -> str:
-        """Calculate file checksum"""
+        """Calculate file checksum; pass algorithm='blake3' for fast non-cryptographic use"""
+        if algorithm == 'blake3' and BLAKE3_AVAILABLE:
+            # blake3 maps the file itself and hashes it across threads
+            hash_algo = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            hash_algo.update_mmap(file_path)
+            return hash_algo.hexdigest()
+        
         hash_algo = hashlib.new(algorithm)
         
-        with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                hash_algo.update(chunk)
+        # Reuse one large buffer so OpenSSL hashes long runs without a new bytes per chunk
+        buffer = bytearray(_CHECKSUM_BLOCK_SIZE)
+        view = memoryview(buffer)
+        with open(file_path, 'rb', buffering=0) as f:
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            while size := f.readinto(buffer):
+                hash_algo.update(view[:size])
         
         return hash_algo.hexdigest()
     
+    @staticmethod
+    def batch_checksum(
+        file_paths: List[str],
+        algorithm: str = 'sha256',
+        max_workers: Optional[int] = None
+    ) -> Dict[str, str]:
+        """Calculate checksums for several files in parallel"""
+        if not file_paths:
+            return {}
+        
+        # hashlib releases the GIL on large updates, so threads hash on separate cores
+        workers = max_workers or min(len(file_paths), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            checksums = executor.map(
+                FileHelper.calculate_checksum, file_paths, [algorithm] * len(file_paths)
+            )
+            return dict(zip(file_paths, checksums))
+    
+    @staticmethod
+    async def async_checksum(file_path: str, algorithm: str = 'sha256') -> str:
+        """Calculate file checksum in a worker thread without blocking the event loop"""
+        return await asyncio.to_thread(FileHelper.calculate_checksum, file_path, algorithm)
+    
     @staticmethod
     async def async_read_file(file_path: str) -> bytes:
         """Asynchronously read file content"""
@@ -120,12 +301,11 @@ class FileHelper:
     @staticmethod
     def safe_filename(filename: str, max_length: int = 200) -> str:
         """Create safe filename by removing problematic characters"""
-        import re
         # Replace problematic characters with underscores
-        safe = re.sub(r'[<>:"/\\|?*\x00-\x1f]', '_', filename)
+        safe = _UNSAFE_FILENAME_CHARS.sub('_', filename)
         
         # Remove multiple underscores
-        safe = re.sub(r'_+', '_', safe)
+        safe = _MULTI_UNDERSCORE.sub('_', safe)
         
         # Trim and ensure length limit
         safe = safe.strip('_')[:max_length]
@@ -136,15 +316,28 @@ class FileHelper:
     def get_directory_size(directory: Union[str, Path]) -> int:
         """Calculate total size of directory recursively"""
         total_size = 0
-        directory = Path(directory)
+        subdirectories = []
         
-        if directory.exists():
-            for file_path in directory.rglob('*'):
-                if file_path.is_file():
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
                     try:
-                        total_size += file_path.stat().st_size
-                    except (OSError, IOError):
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirectories.append(entry.path)
+                        elif entry.is_file():
+                            total_size += entry.stat().st_size
+                    except OSError:
                         pass
+        except OSError:
+            return 0
+        
+        if len(subdirectories) > 1:
+            # Walk top-level subtrees in parallel so stat latency overlaps
+            workers = min(32, (os.cpu_count() or 1) * 4, len(subdirectories))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                total_size += sum(executor.map(_scan_directory_size, subdirectories))
+        elif subdirectories:
+            total_size += _scan_directory_size(subdirectories[0])
         
         return total_size
 
@@ -163,31 +356,34 @@ class StringHelper:
     @staticmethod
     def normalize_whitespace(text: str) -> str:
         """Normalize whitespace in text"""
-        import re
         # Replace multiple whitespace with single space
-        normalized = re.sub(r'\s+', ' ', text)
+        normalized = _WHITESPACE_RUN.sub(' ', text)
         return normalized.strip()
     
     @staticmethod
     def extract_words(text: str, min_length: int = 3) -> List[str]:
         """Extract words from text, filtering by minimum length"""
-        import re
-        words = re.findall(r'\b[a-zA-Z]{' + str(min_length) + r',}\b', text.lower())
-        return list(set(words))  # Remove duplicates
+        words = _word_pattern(min_length).findall(text.lower())
+        return list(dict.fromkeys(words))  # Remove duplicates, keeping first-seen order
     
     @staticmethod
     def calculate_similarity(text1: str, text2: str) -> float:
         """Calculate similarity between two texts (0.0 to 1.0)"""
-        from difflib import SequenceMatcher
+        if text1 == text2:
+            return 1.0
+        if RAPIDFUZZ_AVAILABLE:
+            # Indel-based ratio in C++; same scale as SequenceMatcher.ratio()
+            return _rapidfuzz_ratio(text1, text2) / 100.0
         return SequenceMatcher(None, text1, text2).ratio()
     
     @staticmethod
     def generate_slug(text: str, max_length: int = 50) -> str:
         """Generate URL-friendly slug from text"""
-        import re
         # Convert to lowercase and replace non-alphanumeric with hyphens
-        slug = re.sub(r'[^a-zA-Z0-9\s-]', '', text.lower())
-        slug = re.sub(r'[\s-]+', '-', slug)
+        slug = text.lower()
+        # translate only covers ASCII; other input still goes through the regex
+        slug = slug.translate(_SLUG_ASCII_DELETE) if slug.isascii() else _SLUG_INVALID_CHARS.sub('', slug)
+        slug = _SLUG_SEPARATORS.sub('-', slug)
         slug = slug.strip('-')[:max_length]
         
         return slug or 'unnamed'
@@ -195,20 +391,8 @@ class StringHelper:
     @staticmethod
     def mask_sensitive_data(text: str) -> str:
         """Mask potentially sensitive data in text"""
-        import re
-        
-        # Mask email addresses
-        text = re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', 
-                     '[EMAIL_MASKED]', text)
-        
-        # Mask phone numbers
-        text = re.sub(r'\b(?:\+?1[-.\s]?)?(?:\(?[0-9]{3}\)?[-.\s]?)?[0-9]{3}[-.\s]?[0-9]{4}\b', 
-                     '[PHONE_MASKED]', text)
-        
-        # Mask potential credit card numbers
-        text = re.sub(r'\b(?:\d{4}[-\s]?){3}\d{4}\b', '[CARD_MASKED]', text)
-        
-        return text
+        # Mask email addresses, potential credit card numbers and phone numbers in one pass
+        return _SENSITIVE_PATTERN.sub(lambda m: _SENSITIVE_MASKS[m.lastgroup], text)
 
 
 class JSONHelper:
@@ -218,6 +402,8 @@ class JSONHelper:
     def safe_json_loads(json_str: str, default: Any = None) -> Any:
         """Safely parse JSON string with fallback"""
         try:
+            if ORJSON_AVAILABLE:
+                return orjson.loads(json_str)
             return json.loads(json_str)
         except (json.JSONDecodeError, TypeError):
             return default
@@ -226,6 +412,8 @@ class JSONHelper:
     def safe_json_dumps(obj: Any, default: str = '{}') -> str:
         """Safely serialize object to JSON with fallback"""
         try:
+            if ORJSON_AVAILABLE:
+                return orjson.dumps(obj, default=str, option=_ORJSON_DUMPS_OPTIONS).decode('utf-8')
             return json.dumps(obj, default=str, ensure_ascii=False, indent=2)
         except (TypeError, ValueError):
             return default
@@ -233,39 +421,51 @@ class JSONHelper:
     @staticmethod
     def flatten_json(data: Dict[str, Any], separator: str = '.') -> Dict[str, Any]:
         """Flatten nested JSON object"""
-        def _flatten(obj: Any, parent_key: str = '') -> Dict[str, Any]:
-            items = []
+        flattened = {}
+        # Explicit DFS stack; children are pushed in reverse so keys keep document order
+        stack = [(data, '')]
+        
+        while stack:
+            obj, parent_key = stack.pop()
             
             if isinstance(obj, dict):
-                for key, value in obj.items():
-                    new_key = f"{parent_key}{separator}{key}" if parent_key else key
-                    items.extend(_flatten(value, new_key).items())
+                children = [
+                    (value, f"{parent_key}{separator}{key}" if parent_key else key)
+                    for key, value in obj.items()
+                ]
             elif isinstance(obj, list):
-                for i, value in enumerate(obj):
-                    new_key = f"{parent_key}{separator}{i}" if parent_key else str(i)
-                    items.extend(_flatten(value, new_key).items())
+                children = [
+                    (value, f"{parent_key}{separator}{i}" if parent_key else str(i))
+                    for i, value in enumerate(obj)
+                ]
             else:
-                return {parent_key: obj}
+                flattened[parent_key] = obj
+                continue
             
-            return dict(items)
+            children.reverse()
+            stack.extend(children)
         
-        return _flatten(data)
+        return flattened
     
     @staticmethod
     def merge_json_objects(obj1: Dict[str, Any], obj2: Dict[str, Any]) -> Dict[str, Any]:
-        """Deep merge two JSON objects"""
-        import copy
-        result = copy.deepcopy(obj1)
+        """
+        Deep merge two JSON objects
         
-        def _merge(target: Dict[str, Any], source: Dict[str, Any]):
+        Only dicts along the merge path are copied; untouched subtrees and
+        leaf values are shared with the inputs rather than deep-copied.
+        """
+        def _merge(target: Dict[str, Any], source: Dict[str, Any]) -> Dict[str, Any]:
+            result = dict(target)
             for key, value in source.items():
-                if key in target and isinstance(target[key], dict) and isinstance(value, dict):
-                    _merge(target[key], value)
+                current = result.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    result[key] = _merge(current, value)
                 else:
-                    target[key] = copy.deepcopy(value)
+                    result[key] = value
+            return result
         
-        _merge(result, obj2)
-        return result
+        return _merge(obj1, obj2)
 
 
 class HashHelper:
@@ -274,25 +474,34 @@ class HashHelper:
     @staticmethod
     def generate_id(prefix: str = '', length: int = 8) -> str:
         """Generate unique ID with optional prefix"""
-        unique_id = str(uuid.uuid4()).replace('-', '')[:length]
+        # Draw only the random bytes needed rather than formatting and trimming a full uuid4
+        unique_id = os.urandom((length + 1) // 2).hex()[:length]
         return f"{prefix}{unique_id}" if prefix else unique_id
     
     @staticmethod
     def hash_string(text: str, algorithm: str = 'sha256') -> str:
         """Generate hash of string"""
-        return hashlib.new(algorithm, text.encode('utf-8')).hexdigest()
+        # Short strings such as names and headers repeat a lot; long ones are not worth keeping
+        if len(text) <= _HASH_CACHE_MAX_TEXT:
+            return _cached_hexdigest(text, algorithm)
+        return _hexdigest(text, algorithm)
     
     @staticmethod
-    def hash_dict(data: Dict[str, Any]) -> str:
+    def hash_dict(data: Dict[str, Any], algorithm: str = 'sha256') -> str:
         """Generate hash of dictionary (order-independent)"""
         # Sort keys to ensure consistent hash
         sorted_json = json.dumps(data, sort_keys=True, default=str)
-        return hashlib.sha256(sorted_json.encode('utf-8')).hexdigest()
+        return _hexdigest(sorted_json, algorithm)
     
     @staticmethod
-    def short_hash(text: str, length: int = 8) -> str:
+    def short_hash(text: str, length: int = 8, algorithm: str = 'sha256') -> str:
         """Generate short hash for display purposes"""
-        return hashlib.sha256(text.encode('utf-8')).hexdigest()[:length]
+        if algorithm == 'blake3' and BLAKE3_AVAILABLE:
+            # Ask for just the bytes needed instead of slicing a full digest
+            hash_algo = _new_hash(algorithm)
+            hash_algo.update(text.encode('utf-8'))
+            return hash_algo.hexdigest(length=(length + 1) // 2)[:length]
+        return HashHelper.hash_string(text, algorithm)[:length]
 
 
 class PerformanceHelper:
@@ -303,11 +512,12 @@ class PerformanceHelper:
         """Decorator to time function execution"""
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             result = func(*args, **kwargs)
-            end_time = time.time()
             
-            logger.debug(f"Function {func.__name__} took {end_time - start_time:.4f} seconds")
+            if logger.isEnabledFor(logging.DEBUG):
+                elapsed = (time.perf_counter_ns() - start_ns) / 1e9
+                logger.debug("Function %s took %.4f seconds", func.__name__, elapsed)
             return result
         
         return wrapper
@@ -317,11 +527,12 @@ class PerformanceHelper:
         """Decorator to time async function execution"""
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             result = await func(*args, **kwargs)
-            end_time = time.time()
             
-            logger.debug(f"Async function {func.__name__} took {end_time - start_time:.4f} seconds")
+            if logger.isEnabledFor(logging.DEBUG):
+                elapsed = (time.perf_counter_ns() - start_ns) / 1e9
+                logger.debug("Async function %s took %.4f seconds", func.__name__, elapsed)
             return result
         
         return wrapper
@@ -338,14 +549,8 @@ class PerformanceHelper:
     @staticmethod
     def batch_process(items: List[T], batch_size: int, processor: Callable[[List[T]], Any]) -> List[Any]:
         """Process items in batches"""
-        results = []
-        
-        for i in range(0, len(items), batch_size):
-            batch = items[i:i + batch_size]
-            result = processor(batch)
-            results.append(result)
-        
-        return results
+        # Comprehension avoids the per-batch append lookup and call
+        return [processor(items[i:i + batch_size]) for i in range(0, len(items), batch_size)]
     
     @staticmethod
     async def async_batch_process(
@@ -355,19 +560,35 @@ class PerformanceHelper:
         max_concurrent: int = 5
     ) -> List[Any]:
         """Process items in async batches with concurrency limit"""
-        semaphore = asyncio.Semaphore(max_concurrent)
+        # A fixed pool of workers pulls from a bounded queue, so only a few batches are alive at once
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max_concurrent * 2)
+        results: Dict[int, Any] = {}
         
-        async def process_batch(batch: List[T]) -> Any:
-            async with semaphore:
-                return await processor(batch)
+        async def produce():
+            iterator = iter(items)
+            index = 0
+            while batch := list(islice(iterator, batch_size)):
+                await queue.put((index, batch))
+                index += 1
+            for _ in range(max_concurrent):
+                await queue.put(None)
         
-        tasks = []
-        for i in range(0, len(items), batch_size):
-            batch = items[i:i + batch_size]
-            task = asyncio.create_task(process_batch(batch))
-            tasks.append(task)
+        async def work():
+            while (entry := await queue.get()) is not None:
+                index, batch = entry
+                results[index] = await processor(batch)
         
-        return await asyncio.gather(*tasks)
+        tasks = [asyncio.create_task(produce())]
+        tasks.extend(asyncio.create_task(work()) for _ in range(max_concurrent))
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # A failed batch would otherwise leave the producer blocked on a full queue
+            for task in tasks:
+                task.cancel()
+            raise
+        
+        return [results[index] for index in range(len(results))]
 
 
 class MemoryHelper:
@@ -377,7 +598,7 @@ class MemoryHelper:
     def get_memory_usage() -> Dict[str, float]:
         """Get current memory usage statistics"""
         import psutil
-        process = psutil.Process(os.getpid())
+        process = _process_for_pid(os.getpid())
         memory_info = process.memory_info()
         
         return {
@@ -393,11 +614,10 @@ class MemoryHelper:
         def decorator(func: Callable[..., T]) -> Callable[..., T]:
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
-                memory_before = MemoryHelper.get_memory_usage()
+                # Only RSS is needed for the delta; skip the system-wide stats
+                rss_before = _rss_bytes()
                 result = func(*args, **kwargs)
-                memory_after = MemoryHelper.get_memory_usage()
-                
-                memory_increase = memory_after['rss_mb'] - memory_before['rss_mb']
+                memory_increase = (_rss_bytes() - rss_before) / 1024 / 1024
                 
                 if memory_increase > threshold_mb:
                     logger.warning(
@@ -416,14 +636,19 @@ class ConfigHelper:
     @staticmethod
     def get_env_bool(key: str, default: bool = False) -> bool:
         """Get boolean from environment variable"""
-        value = os.getenv(key, '').lower()
-        return value in ('true', '1', 'yes', 'on')
+        value = os.getenv(key)
+        if value is None:
+            return default
+        return value.lower() in ('true', '1', 'yes', 'on')
     
     @staticmethod
     def get_env_int(key: str, default: int = 0) -> int:
         """Get integer from environment variable"""
+        value = os.getenv(key)
+        if value is None:
+            return default
         try:
-            return int(os.getenv(key, str(default)))
+            return int(value)
         except ValueError:
             return default
     
@@ -434,7 +659,8 @@ class ConfigHelper:
         if not value:
             return default or []
         
-        return [item.strip() for item in value.split(separator) if item.strip()]
+        # Cached on the raw value, so a changed variable is simply a new key
+        return list(_split_env_list(value, separator))
     
     @staticmethod
     def validate_required_env_vars(required_vars: List[str]) -> List[str]:
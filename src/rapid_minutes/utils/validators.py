@@ -4,14 +4,161 @@ Comprehensive validation functions for files, data, and system inputs
 Implements MECE principle - complete validation coverage without overlap
 """
 
+import codecs
 import re
-import magic
+import threading
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 import email_validator
 import validators
 
+# Optional magic import; only needed to name types the header checks don't recognise
+try:
+    import magic
+    HAS_MAGIC = True
+except ImportError:
+    HAS_MAGIC = False
+
+_SNIFF_BYTES = 4096
+_PDF_SIGNATURE = b'%PDF-'
+# Control bytes libmagic does not accept in text (tab, newlines, form feed, backspace, bell and ESC are fine)
+_BINARY_CONTROL_BYTES = bytes([*range(0x00, 0x07), *range(0x0e, 0x1b), *range(0x1c, 0x20), 0x7f])
+
+
+def _looks_like_text(head: bytes) -> bool:
+    """True if head is non-empty UTF-8 text without binary control bytes"""
+    if not head or len(head.translate(None, _BINARY_CONTROL_BYTES)) != len(head):
+        return False
+    try:
+        # final=False tolerates a multi-byte character cut off by the sniff window
+        codecs.getincrementaldecoder('utf-8')().decode(head, final=False)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+_magic_local = threading.local()
+
+
+def _mime_magic() -> 'magic.Magic':
+    """Per-thread libmagic cookie, so threadpool routes never wait on a shared lock"""
+    instance = getattr(_magic_local, 'instance', None)
+    if instance is None:
+        instance = _magic_local.instance = magic.Magic(mime=True)
+    return instance
+
+
+def _is_pdf(file_data: bytes) -> bool:
+    """True if file_data starts with the PDF signature"""
+    return file_data.startswith(_PDF_SIGNATURE)
+
+
+def _is_plain_text(file_data: bytes) -> bool:
+    """True if file_data is text; an all-ASCII PDF header counts as PDF, as with libmagic"""
+    return not _is_pdf(file_data) and _looks_like_text(file_data[:_SNIFF_BYTES])
+
+
+# Header detectors for the supported types, most frequent upload first
+_MIME_DETECTORS = {
+    'text/plain': _is_plain_text,
+    'application/pdf': _is_pdf,
+}
+
+
+def _sniff_mime_type(file_data: bytes, expected: Optional[str] = None) -> Optional[str]:
+    """Detect the supported types from the leading bytes, trying the expected type first"""
+    if expected in _MIME_DETECTORS and _MIME_DETECTORS[expected](file_data):
+        return expected
+    for mime_type, detector in _MIME_DETECTORS.items():
+        if mime_type != expected and detector(file_data):
+            return mime_type
+    return None
+
+
+_SCRIPT_INJECTION_SOURCES = (
+    r'<script[^>]*>.*?</script>',
+    r'javascript:',
+    r'vbscript:',
+    r'onload\s*=',
+    r'onerror\s*=',
+    r'onclick\s*=',
+    r'<iframe[^>]*>',
+    r'<object[^>]*>',
+    r'<embed[^>]*>',
+)
+
+# Patterns with no unbounded span share one alternation; group N (1-based) is
+# _SCRIPT_INJECTION_LINEAR[N - 1]
+_SCRIPT_INJECTION_LINEAR = _SCRIPT_INJECTION_SOURCES[1:6]
+_SCRIPT_INJECTION_RE = re.compile(
+    '|'.join(f'({pattern})' for pattern in _SCRIPT_INJECTION_LINEAR), re.IGNORECASE
+)
+
+# The tag patterns rescan to the end of input from every '<tag' start under re,
+# which is quadratic on repeated unclosed tags; they are matched with find() instead
+_SCRIPT_BLOCK_PATTERN = _SCRIPT_INJECTION_SOURCES[0]
+_OPEN_TAG_PATTERNS = tuple(
+    (pattern, pattern[:-len('[^>]*>')]) for pattern in _SCRIPT_INJECTION_SOURCES[6:]
+)
+
+
+def _has_open_tag(text_lower: str, tag: str) -> bool:
+    """Linear equivalent of searching tag + r'[^>]*>'"""
+    # A '>' after any occurrence is also after the first one
+    start = text_lower.find(tag)
+    return start != -1 and text_lower.find('>', start + len(tag)) != -1
+
+
+def _has_script_block(text_lower: str) -> bool:
+    """Linear equivalent of searching r'<script[^>]*>.*?</script>' (without DOTALL)"""
+    tag, closing = '<script', '</script>'
+    tag_end = close = newline = -1
+    start = text_lower.find(tag)
+
+    while start != -1:
+        # [^>]* stops at the first '>', which later starts often share
+        if tag_end < start + len(tag):
+            tag_end = text_lower.find('>', start + len(tag))
+            if tag_end == -1:
+                return False
+
+            # .*? must reach the closing tag before the next newline
+            if close <= tag_end:
+                close = text_lower.find(closing, tag_end + 1)
+                if close == -1:
+                    return False
+            if newline <= tag_end:
+                newline = text_lower.find('\n', tag_end + 1)
+                if newline == -1:
+                    newline = len(text_lower)
+            if close < newline:
+                return True
+
+        start = text_lower.find(tag, start + 1)
+
+    return False
+
+
+_PATH_TRAVERSAL_MARKERS = (
+    '..',
+    '~/',
+    '/etc/',
+    '/proc/',
+    '/sys/',
+    '\\windows\\',
+    '\\system32\\'
+)
+
+_DANGEROUS_FILENAME_CHARS = ('/', '\\', ':', '*', '?', '"', '<', '>', '|', '\0')
+
+# Reserved device names (Windows)
+_RESERVED_FILENAMES = frozenset({
+    'CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3', 'COM4', 'COM5',
+    'COM6', 'COM7', 'COM8', 'COM9', 'LPT1', 'LPT2', 'LPT3', 'LPT4',
+    'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
+})
+
 
 class FileValidator:
     """File validation utilities"""
@@ -39,15 +186,25 @@ class FileValidator:
             (is_valid, mime_type_or_error)
         """
         try:
-            # Detect MIME type from content
-            mime_type = magic.from_buffer(file_data, mime=True)
+            file_ext = Path(filename).suffix.lower()
+            # The type the extension claims is almost always right, so its detector runs first
+            expected_type = next(
+                (mime for mime, spec in FileValidator.SUPPORTED_TYPES.items() if file_ext in spec['extensions']),
+                None
+            )
+            
+            # Detect MIME type from content; libmagic is only asked to name anything else
+            mime_type = _sniff_mime_type(file_data, expected_type)
+            if mime_type is None:
+                # libmagic signatures only look at leading bytes
+                head = file_data[:_SNIFF_BYTES]
+                mime_type = _mime_magic().from_buffer(head) if HAS_MAGIC else 'application/octet-stream'
             
             # Check if MIME type is supported
             if mime_type not in FileValidator.SUPPORTED_TYPES:
                 return False, f"Unsupported file type: {mime_type}"
             
             # Check file extension
-            file_ext = Path(filename).suffix.lower()
             allowed_extensions = FileValidator.SUPPORTED_TYPES[mime_type]['extensions']
             
             if file_ext not in allowed_extensions:
@@ -84,19 +241,12 @@ class FileValidator:
             return False, "Filename too long (max 255 characters)"
         
         # Check for dangerous characters
-        dangerous_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|', '\0']
-        if any(char in filename for char in dangerous_chars):
-            return False, f"Filename contains prohibited characters: {dangerous_chars}"
+        if any(char in filename for char in _DANGEROUS_FILENAME_CHARS):
+            return False, f"Filename contains prohibited characters: {list(_DANGEROUS_FILENAME_CHARS)}"
         
         # Check for reserved names (Windows)
-        reserved_names = [
-            'CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3', 'COM4', 'COM5',
-            'COM6', 'COM7', 'COM8', 'COM9', 'LPT1', 'LPT2', 'LPT3', 'LPT4',
-            'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
-        ]
-        
         name_without_ext = Path(filename).stem.upper()
-        if name_without_ext in reserved_names:
+        if name_without_ext in _RESERVED_FILENAMES:
             return False, f"Filename uses reserved name: {name_without_ext}"
         
         return True, "Filename valid"
@@ -375,21 +525,17 @@ class SecurityValidator:
     @staticmethod
     def validate_no_script_injection(text: str) -> Tuple[bool, str]:
         """Check for potential script injection"""
-        dangerous_patterns = [
-            r'<script[^>]*>.*?</script>',
-            r'javascript:',
-            r'vbscript:',
-            r'onload\s*=',
-            r'onerror\s*=',
-            r'onclick\s*=',
-            r'<iframe[^>]*>',
-            r'<object[^>]*>',
-            r'<embed[^>]*>',
-        ]
-        
         text_lower = text.lower()
-        for pattern in dangerous_patterns:
-            if re.search(pattern, text_lower, re.IGNORECASE):
+        if _has_script_block(text_lower):
+            return False, f"Potential script injection detected: {_SCRIPT_BLOCK_PATTERN}"
+        
+        match = _SCRIPT_INJECTION_RE.search(text_lower)
+        if match:
+            pattern = _SCRIPT_INJECTION_LINEAR[match.lastindex - 1]
+            return False, f"Potential script injection detected: {pattern}"
+        
+        for pattern, tag in _OPEN_TAG_PATTERNS:
+            if _has_open_tag(text_lower, tag):
                 return False, f"Potential script injection detected: {pattern}"
         
         return True, "No script injection detected"
@@ -397,18 +543,8 @@ class SecurityValidator:
     @staticmethod
     def validate_no_path_traversal(path: str) -> Tuple[bool, str]:
         """Check for path traversal attempts"""
-        dangerous_patterns = [
-            '..',
-            '~/',
-            '/etc/',
-            '/proc/',
-            '/sys/',
-            '\\windows\\',
-            '\\system32\\'
-        ]
-        
         path_lower = path.lower()
-        for pattern in dangerous_patterns:
+        for pattern in _PATH_TRAVERSAL_MARKERS:
             if pattern in path_lower:
                 return False, f"Potential path traversal detected: {pattern}"
         
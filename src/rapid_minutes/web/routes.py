@@ -1,4 +1,5 @@
 import logging
+import os
 from dataclasses import asdict
 from fastapi import APIRouter, File, UploadFile, HTTPException, BackgroundTasks
 from fastapi.responses import FileResponse
@@ -19,6 +20,11 @@ data_extractor = StructuredDataExtractor(ollama_client)
 text_processor = TextProcessor()
 template_controller = TemplateController()
 
+_ALLOWED_EXTENSIONS = ('.txt', '.doc', '.docx')
+_ALLOWED_EXTENSION_SET = frozenset(_ALLOWED_EXTENSIONS)
+_MAX_UPLOAD_BYTES = 10 * 1024 * 1024  # 10MB limit
+_UPLOAD_CHUNK_SIZE = 64 * 1024
+
 
 @router.post("/api/upload")
 async def upload_file(file: UploadFile = File(...)):
@@ -38,27 +44,27 @@ async def upload_file(file: UploadFile = File(...)):
             raise HTTPException(status_code=400, detail="Invalid filename")
 
         # Check file type
-        allowed_extensions = ['.txt', '.doc', '.docx']
-        file_ext = '.' + file.filename.split('.')[-1].lower()
-        if file_ext not in allowed_extensions:
+        file_ext = os.path.splitext(file.filename)[1].lower()
+        if file_ext not in _ALLOWED_EXTENSION_SET:
             raise HTTPException(
                 status_code=400,
-                detail=f"Unsupported file type. Allowed: {allowed_extensions}"
+                detail=f"Unsupported file type. Allowed: {list(_ALLOWED_EXTENSIONS)}"
             )
 
         # Check file size
-        if file.size and file.size > 10 * 1024 * 1024:  # 10MB limit
+        if file.size and file.size > _MAX_UPLOAD_BYTES:
             raise HTTPException(status_code=413, detail="File too large (max 10MB)")
 
-        # Read file content
-        file_content = await file.read()
+        # Read file content in chunks so an oversized body is rejected without buffering all of it
+        file_content = bytearray()
+        while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+            file_content += chunk
+            if len(file_content) > _MAX_UPLOAD_BYTES:
+                raise HTTPException(status_code=413, detail="File content too large")
 
         # Validate content size
         if len(file_content) == 0:
             raise HTTPException(status_code=400, detail="Empty file not allowed")
-
-        if len(file_content) > 10 * 1024 * 1024:  # 10MB limit
-            raise HTTPException(status_code=413, detail="File content too large")
         
         # Save file
         file_metadata = await file_manager.store_file(file_content, file.filename)
@@ -83,4 +83,45 @@ class TestAPI:
             "download": "Download generated documents"
         }
         
-        assert len(expected_structure) == 3
\ No newline at end of file
+        assert len(expected_structure) == 3
+
+def _meeting_text(size):
+    """Plain-text upload body of exactly size bytes"""
+    # Short lines keep multipart parsing fast for multi-megabyte bodies
+    line = b"Action item: review the quarterly report\n"
+    return (line * (size // len(line) + 1))[:size]
+
+
+class TestUploadSizeLimit:
+    """Upload size limit tests"""
+    
+    @pytest.fixture
+    def client(self, tmp_path):
+        """Create test client storing uploads under a temporary directory"""
+        from rapid_minutes.storage.file_manager import FileManager
+        
+        with patch('rapid_minutes.web.routes.file_manager', FileManager(str(tmp_path))):
+            yield TestClient(app)
+    
+    def test_upload_at_limit_succeeds(self, client):
+        """Test that a file of exactly the maximum size is accepted"""
+        from rapid_minutes.web.routes import _MAX_UPLOAD_BYTES
+        
+        response = client.post(
+            "/api/upload",
+            files={"file": ("meeting.txt", _meeting_text(_MAX_UPLOAD_BYTES), "text/plain")}
+        )
+        
+        assert response.status_code == 200
+        assert response.json()["size"] == _MAX_UPLOAD_BYTES
+    
+    def test_upload_over_limit_rejected(self, client):
+        """Test that a file one byte over the maximum size is rejected with 413"""
+        from rapid_minutes.web.routes import _MAX_UPLOAD_BYTES
+        
+        response = client.post(
+            "/api/upload",
+            files={"file": ("meeting.txt", _meeting_text(_MAX_UPLOAD_BYTES + 1), "text/plain")}
+        )
+        
+        assert response.status_code == 413
@@ -7,6 +7,7 @@ import pytest
 import asyncio
 import tempfile
 import os
+import re
 from unittest.mock import patch, MagicMock, AsyncMock
 from pathlib import Path
 
@@ -390,5 +391,94 @@ class TestDataValidation:
             assert not is_safe, f"Path {path} should be blocked"
 
 
+
+# The per-pattern checks SecurityValidator.validate_no_script_injection replaced
+_LEGACY_SCRIPT_INJECTION_PATTERNS = [
+    r'<script[^>]*>.*?</script>',
+    r'javascript:',
+    r'vbscript:',
+    r'onload\s*=',
+    r'onerror\s*=',
+    r'onclick\s*=',
+    r'<iframe[^>]*>',
+    r'<object[^>]*>',
+    r'<embed[^>]*>',
+]
+
+
+def _legacy_script_injection_flagged(text):
+    text_lower = text.lower()
+    return any(re.search(pattern, text_lower, re.IGNORECASE) for pattern in _LEGACY_SCRIPT_INJECTION_PATTERNS)
+
+
+class TestScriptInjectionDetection:
+    """Script injection checks match the original per-pattern search"""
+
+    @pytest.mark.parametrize("text", [
+        "Regular meeting notes",
+        "<script>alert(1)</script>",
+        "<ScRiPt>alert(1)</sCrIpT>",
+        "<script type='text/javascript' src=x></script>",
+        "<script>\nalert(1)</script>",
+        "<script\ntype='module'>alert(1)</script>",
+        "<script>alert(1)\n</script>",
+        "<script>alert(1)",
+        "<script",
+        "<script <script>x</script>",
+        "before <script> then\nlater </script>",
+        "JavaScript:alert(1)",
+        "href='vbscript:msgbox'",
+        "<img onerror=alert(1)>",
+        "<body ONLOAD = init()>",
+        "<a onclick\t=go()>",
+        "onclick without equals",
+        "<iframe src=x>",
+        "<IFRAME",
+        "<object data=x",
+        "<object data=x>",
+        "<embed\nsrc=x>",
+        "a > b < c",
+        "<scriptx>y</script>",
+        "<script>" * 50,
+        "<iframe" * 50,
+    ])
+    def test_flags_same_inputs_as_pattern_list(self, text):
+        """Test that the fused checks flag exactly what the pattern list flagged"""
+        from src.rapid_minutes.utils.validators import SecurityValidator
+
+        is_safe, message = SecurityValidator.validate_no_script_injection(text)
+
+        assert is_safe == (not _legacy_script_injection_flagged(text)), message
+
+    def test_flags_same_random_inputs_as_pattern_list(self):
+        """Test parity on seeded random mixes of tag fragments, handlers and newlines"""
+        import random
+        from src.rapid_minutes.utils.validators import SecurityValidator
+
+        fragments = ['<script', '<SCRIPT', ' type=x', '>', '</script>', '</Script>', '\n', 'text',
+                     '<iframe', '<object', '<embed', 'javascript:', 'vbscript:', 'onload', 'onerror',
+                     'onclick', '=', ' ', '\t', '<', '/']
+        rng = random.Random(2024)
+        for _ in range(5000):
+            text = ''.join(rng.choice(fragments) for _ in range(rng.randint(0, 10)))
+            is_safe, _ = SecurityValidator.validate_no_script_injection(text)
+            assert is_safe == (not _legacy_script_injection_flagged(text)), repr(text)
+
+    @pytest.mark.parametrize("text, pattern", [
+        ("<script>x</script>", r'<script[^>]*>.*?</script>'),
+        ("javascript:void(0)", r'javascript:'),
+        ("<div onload=x>", r'onload\s*='),
+        ("<embed src=x>", r'<embed[^>]*>'),
+    ])
+    def test_reports_matching_pattern(self, text, pattern):
+        """Test that the message names the pattern that matched"""
+        from src.rapid_minutes.utils.validators import SecurityValidator
+
+        is_safe, message = SecurityValidator.validate_no_script_injection(text)
+
+        assert not is_safe
+        assert message == f"Potential script injection detected: {pattern}"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -8,7 +8,10 @@ import asyncio
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 import json
+import re
 import tempfile
+from io import BytesIO
+from zipfile import ZipFile, ZIP_DEFLATED
 
 # These imports will work once the document modules are implemented
 # from src.rapid_minutes.document.word_engine import WordTemplateEngine
@@ -220,4 +223,231 @@ class TestTemplateManagement:
             'preview_generation'
         ]
         
-        assert len(custom_features) == 4
\ No newline at end of file
+        assert len(custom_features) == 4
+
+
+SAMPLE_MEETING = {
+    'meeting_title': 'Weekly Sync',
+    'date': '2024-01-01',
+    'location': 'Room 3',
+    'attendees': ['Alice', 'Bob'],
+    'key_topics': ['Release timing'],
+    'decisions': ['Ship in Q2'],
+    'action_items': [{'task': 'Draft plan', 'assignee': 'Alice', 'deadline': '2024-01-08', 'priority': 'high'}]
+}
+
+# Generation timestamps written into the document body and footer
+_TIMESTAMP_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}|\d{4}年\d{2}月\d{2}日 \d{2}:\d{2}')
+
+
+def _document_xml(word_content):
+    """Body XML of a generated document with its generation timestamps masked"""
+    with ZipFile(BytesIO(word_content)) as package:
+        return _TIMESTAMP_PATTERN.sub('', package.read('word/document.xml').decode('utf-8'))
+
+
+class TestWordGeneratorBatch:
+    """WordGenerator.generate_batch tests"""
+    
+    def test_single_and_multiple_workers_match(self):
+        """Test that worker processes produce the same documents, in order, as the in-process path"""
+        from src.rapid_minutes.document.word_generator import WordGenerator
+        
+        items = [dict(SAMPLE_MEETING, meeting_title=f'Meeting {i}') for i in range(4)]
+        
+        sequential = WordGenerator.generate_batch(items, workers=1)
+        parallel = WordGenerator.generate_batch(items, workers=2)
+        
+        assert len(sequential) == len(parallel) == len(items)
+        for i, (expected, actual) in enumerate(zip(sequential, parallel)):
+            assert f'Meeting {i}' in _document_xml(actual)
+            assert _document_xml(expected) == _document_xml(actual)
+    
+    def test_empty_batch(self):
+        """Test that an empty batch starts no workers"""
+        from src.rapid_minutes.document.word_generator import WordGenerator
+        
+        assert WordGenerator.generate_batch([], workers=2) == []
+    
+    @pytest.mark.parametrize('workers', [1, 2])
+    def test_error_in_one_meeting_propagates(self, workers):
+        """Test that a failing meeting fails the whole batch"""
+        from src.rapid_minutes.document.word_generator import WordGenerator
+        
+        items = [SAMPLE_MEETING, dict(SAMPLE_MEETING, attendees=5)]
+        
+        with pytest.raises(TypeError):
+            WordGenerator.generate_batch(items, workers=workers)
+
+
+class TestSubmitDocumentsBundle:
+    """WordGenerator.submit_documents_bundle tests"""
+    
+    def teardown_method(self):
+        from src.rapid_minutes.document.word_generator import WordGenerator
+        WordGenerator.shutdown_pdf_executor()
+    
+    def test_future_resolves_to_pdf(self):
+        """Test that the Word bytes come back at once and the future yields the PDF"""
+        from src.rapid_minutes.document.word_generator import WordGenerator
+        
+        generator = WordGenerator()
+        with patch.object(WordGenerator, 'generate_pdf_from_word', return_value=b'%PDF-1.4 converted') as convert:
+            word_content, pdf_future = generator.submit_documents_bundle(SAMPLE_MEETING)
+            
+            assert word_content.startswith(b'PK')
+            assert pdf_future.result(timeout=10) == b'%PDF-1.4 converted'
+            convert.assert_called_once_with(word_content)
+    
+    def test_conversion_error_propagates(self):
+        """Test that a failed conversion surfaces through the future"""
+        from src.rapid_minutes.document.word_generator import WordGenerator
+        
+        generator = WordGenerator()
+        with patch.object(WordGenerator, 'generate_pdf_from_word', side_effect=RuntimeError('converter crashed')):
+            word_content, pdf_future = generator.submit_documents_bundle(SAMPLE_MEETING)
+            
+            assert word_content
+            with pytest.raises(RuntimeError, match='converter crashed'):
+                pdf_future.result(timeout=10)
+    
+    def test_shutdown_allows_new_submissions(self):
+        """Test that shutting the pool down waits for it and a later submit starts a new one"""
+        from src.rapid_minutes.document.word_generator import WordGenerator
+        
+        generator = WordGenerator()
+        with patch.object(WordGenerator, 'generate_pdf_from_word', return_value=b'%PDF-1.4'):
+            _, first = generator.submit_documents_bundle(SAMPLE_MEETING)
+            WordGenerator.shutdown_pdf_executor()
+            assert first.done()
+            assert WordGenerator._pdf_executor is None
+            
+            _, second = generator.submit_documents_bundle(SAMPLE_MEETING)
+            assert second.result(timeout=10) == b'%PDF-1.4'
+
+
+def _replace_document_xml(word_content, document_xml):
+    """Copy of a package with word/document.xml swapped for the given bytes"""
+    buffer = BytesIO()
+    with ZipFile(BytesIO(word_content)) as source, ZipFile(buffer, 'w', ZIP_DEFLATED) as target:
+        for item in source.infolist():
+            data = document_xml if item.filename == 'word/document.xml' else source.read(item)
+            target.writestr(item, data)
+    return buffer.getvalue()
+
+
+class TestWordDocumentValidation:
+    """Streaming Word document validation tests"""
+    
+    @pytest.fixture(scope='class')
+    def generated_document(self):
+        from src.rapid_minutes.document.word_generator import WordGenerator
+        return WordGenerator().generate_document(SAMPLE_MEETING)
+    
+    def test_structure_counts_match_python_docx(self, generated_document):
+        """Test that the streamed counts agree with a full python-docx load"""
+        from docx import Document
+        from src.rapid_minutes.document.word_generator import _count_docx_structure
+        
+        doc = Document(BytesIO(generated_document))
+        expected = (
+            len(doc.paragraphs),
+            len(doc.tables),
+            sum(1 for p in doc.paragraphs if p.style.name.startswith('Heading'))
+        )
+        
+        assert _count_docx_structure(generated_document) == expected
+    
+    def test_generated_document_passes(self, generated_document):
+        """Test that a generated document has no structural issues"""
+        from src.rapid_minutes.document.word_generator import WordGenerator
+        
+        generator = WordGenerator()
+        
+        assert generator._validate_word_document(generated_document) == {'format_specific_issues': []}
+        assert generator.validate_document_output(generated_document, 'docx')['is_valid']
+    
+    def test_truncated_document_xml_fails(self, generated_document):
+        """Test that a document.xml cut off inside its body is reported instead of raising"""
+        from src.rapid_minutes.document.word_generator import WordGenerator
+        
+        with ZipFile(BytesIO(generated_document)) as package:
+            document_xml = package.read('word/document.xml')
+        # Cut before the minimum structure is reached, where streaming would stop early
+        damaged = _replace_document_xml(generated_document, document_xml[:document_xml.index(b'<w:body>') + 64])
+        
+        issues = WordGenerator()._validate_word_document(damaged)['format_specific_issues']
+        
+        assert len(issues) == 1
+        assert issues[0].startswith('Word document validation failed')
+    
+    def test_empty_document_xml_fails(self, generated_document):
+        """Test that an empty document.xml is reported instead of raising"""
+        from src.rapid_minutes.document.word_generator import WordGenerator
+        
+        damaged = _replace_document_xml(generated_document, b'')
+        
+        issues = WordGenerator()._validate_word_document(damaged)['format_specific_issues']
+        
+        assert len(issues) == 1
+        assert issues[0].startswith('Word document validation failed')
+    
+    def test_non_zip_content_fails(self):
+        """Test that content that is not a package at all is reported"""
+        from src.rapid_minutes.document.word_generator import WordGenerator
+        
+        issues = WordGenerator()._validate_word_document(b'not a docx')['format_specific_issues']
+        
+        assert issues and issues[0].startswith('Word document validation failed')
+
+
+class TestWordEngineTemplateProcessing:
+    """WordEngine DOCX template processing tests"""
+    
+    @pytest.mark.asyncio
+    async def test_multiline_description_keeps_breaks(self, tmp_path):
+        """Test that newlines and tabs in inserted agenda text become Word breaks and tabs"""
+        from docx import Document
+        from src.rapid_minutes.document.word_engine import WordEngine
+        
+        template_path = tmp_path / 'agenda_template.docx'
+        template = Document()
+        template.add_paragraph('{{AGENDA_DETAILS}}')
+        template.save(str(template_path))
+        
+        engine = WordEngine(templates_dir=str(tmp_path))
+        engine.temp_dir = str(tmp_path)
+        agenda = [{'title': 'Budget', 'description': 'First line\nSecond line\tnoted'}]
+        
+        result = await engine._process_docx_template(str(template_path), {'agenda': agenda}, {})
+        
+        assert result.success, result.error_message
+        paragraphs = Document(result.output_path).paragraphs
+        description = next(p for p in paragraphs if '說明' in p.text)
+        assert description.text == '   說明: First line\nSecond line\tnoted'
+        assert len(description._p.xpath('.//w:br')) == 1
+        assert len(description._p.xpath('.//w:tab')) == 1
+    
+    @pytest.mark.asyncio
+    async def test_failed_save_leaves_no_temp_file(self, tmp_path):
+        """Test that a failed move into place removes the temporary output"""
+        from docx import Document
+        from src.rapid_minutes.document.word_engine import WordEngine
+        
+        template_path = tmp_path / 'plain_template.docx'
+        template = Document()
+        template.add_paragraph('{{MEETING_TITLE}}')
+        template.save(str(template_path))
+        
+        output_dir = tmp_path / 'output'
+        output_dir.mkdir()
+        engine = WordEngine(templates_dir=str(tmp_path))
+        engine.temp_dir = str(output_dir)
+        
+        with patch('src.rapid_minutes.document.word_engine.os.replace', side_effect=OSError('disk full')):
+            result = await engine._process_docx_template(
+                str(template_path), {'meeting_title': 'Weekly Sync'}, {}
+            )
+        
+        assert not result.success
+        assert list(output_dir.iterdir()) == []
@@ -0,0 +1,101 @@
+"""
+Storage Layer Tests
+Tests for registry persistence and temporary storage expiry scheduling
+"""
+
+import pytest
+import heapq
+import json
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+from src.rapid_minutes.storage.file_manager import FileManager
+from src.rapid_minutes.storage.temp_storage import TempStorage
+
+
+# A TTL already in the past makes a file due on the next eviction pass
+EXPIRED = timedelta(seconds=-1)
+
+
+class TestTempStorageExpiry:
+    """Expiry heap tests for TempStorage"""
+
+    @pytest.mark.asyncio
+    async def test_expiry_order(self, tmp_path):
+        """Test that files are queued by expiry time and only due files are evicted"""
+        async with TempStorage(base_temp_dir=str(tmp_path)) as storage:
+            await storage.store_file('later', b'a', 'a.txt', ttl=timedelta(minutes=2))
+            await storage.store_file('due', b'b', 'b.txt', ttl=EXPIRED)
+            await storage.store_file('soon', b'c', 'c.txt', ttl=timedelta(minutes=1))
+
+            queued = [file_id for _, file_id in heapq.nsmallest(3, storage._expiry_heap)]
+            assert queued == ['due', 'soon', 'later']
+
+            delay = await storage._evict_due_files()
+
+            assert 'due' not in storage._temp_files
+            assert set(storage._temp_files) == {'soon', 'later'}
+            assert 0 < delay <= 60
+
+    @pytest.mark.asyncio
+    async def test_rescheduled_file_survives_stale_entry(self, tmp_path):
+        """Test that re-storing a scheduled file with a longer TTL outlives its old expiry"""
+        async with TempStorage(base_temp_dir=str(tmp_path)) as storage:
+            await storage.store_file('report', b'v1', 'report.txt', ttl=EXPIRED)
+            path = await storage.store_file('report', b'v2', 'report.txt', ttl=timedelta(hours=1))
+
+            assert len(storage._expiry_heap) == 2
+
+            await storage._evict_due_files()
+
+            assert 'report' in storage._temp_files
+            assert Path(path).read_bytes() == b'v2'
+            assert len(storage._expiry_heap) == 1
+
+    @pytest.mark.asyncio
+    async def test_extended_file_survives_stale_entry(self, tmp_path):
+        """Test that extend_ttl keeps a file past the expiry it was first queued with"""
+        async with TempStorage(base_temp_dir=str(tmp_path)) as storage:
+            path = await storage.store_file('draft', b'x', 'draft.txt', ttl=EXPIRED)
+            assert await storage.extend_ttl('draft', additional_hours=1)
+
+            await storage._evict_due_files()
+
+            assert 'draft' in storage._temp_files
+            assert Path(path).exists()
+
+    @pytest.mark.asyncio
+    async def test_file_deleted_before_due(self, tmp_path):
+        """Test that an entry for an already deleted file is dropped quietly"""
+        async with TempStorage(base_temp_dir=str(tmp_path)) as storage:
+            await storage.store_file('gone', b'x', 'gone.txt', ttl=EXPIRED)
+            assert await storage.delete_file('gone')
+
+            delay = await storage._evict_due_files()
+
+            assert storage._expiry_heap == []
+            assert storage._temp_files == {}
+            assert delay == storage._cleanup_interval
+
+
+class TestFileManagerRegistrySave:
+    """Background registry save tests for FileManager"""
+
+    @pytest.mark.asyncio
+    async def test_failed_save_does_not_block_later_saves(self, tmp_path):
+        """Test that a save whose snapshot fails still lets the next update reach disk"""
+        manager = FileManager(str(tmp_path))
+        metadata = await manager.store_file(b'notes', 'notes.txt')
+
+        with patch.object(FileManager, '_serialize_registry', side_effect=TypeError('not serializable')):
+            manager.update_processing_status(metadata.file_id, 'processing', 10)
+            await manager._registry_save_task
+
+        assert not manager._registry_save_scheduled
+
+        manager.update_processing_status(metadata.file_id, 'completed', 100)
+        await manager._registry_save_task
+
+        saved = json.loads(manager._registry_file.read_text(encoding='utf-8'))
+        assert saved[metadata.file_id]['custom_metadata']['status'] == 'completed'